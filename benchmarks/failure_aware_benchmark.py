@@ -0,0 +1,57 @@
+# Compares FRR forwarding with and without failure-aware candidate pruning on a heavily failed topology
+# Author: Leon Okida
+# Last modification: 10/19/2026
+# Usage: python -m benchmarks.failure_aware_benchmark
+
+import random
+import time
+from routing_sim.network import Network
+from routing_sim.packet import Packet
+from routing_sim.routing_algorithms.max_flow_routing import MaxFlowRouting
+from routing_sim.simulation_engine.frr_simulation_engine import FRRSimulationEngine
+from routing_sim.topology_generation import random_graph
+from benchmarks.results import RESULTS_FILE, save_results_to_csv
+
+def run_pairs(network: Network, failed_edges: list, pairs: list, failure_aware: bool) -> tuple[float, list]:
+    # Routes every pair and returns the average time per packet and the routes found
+    engine = FRRSimulationEngine(network, debug_print=False, failure_aware=failure_aware)
+    for edge in failed_edges:
+        engine.add_edge_failure(edge)
+
+    # Only the forwarding is timed, metrics computation is left out
+    routes = []
+    start = time.perf_counter()
+    for source, dest in pairs:
+        packet = Packet(origin_name=source, destination_name=dest)
+        success = engine._find_route_recursive(packet, source, MaxFlowRouting())
+        routes.append((success, packet.path))
+    elapsed = time.perf_counter() - start
+    return elapsed / len(pairs), routes
+
+if __name__ == '__main__':
+    # --- Configuration ---
+    SIZE = 60
+    CONNECTIVITY = 0.1
+    FAILURE_RATIO = 0.3
+    NUMBER_OF_PAIRS = 30
+    SEED = 7
+
+    random.seed(SEED)
+    graph = random_graph(SIZE, CONNECTIVITY)
+    network = Network.from_networkx_graph(graph)
+    edges = list(graph.edges)
+    failed_edges = random.sample(edges, int(len(edges) * FAILURE_RATIO))
+    nodes = list(graph.nodes)
+    pairs = [tuple(random.sample(nodes, 2)) for _ in range(NUMBER_OF_PAIRS)]
+    print(f"Topology: {len(nodes)} nodes, {len(edges)} edges, {len(failed_edges)} failed")
+
+    rows = []
+    for failure_aware in (False, True):
+        latency, routes = run_pairs(network, failed_edges, pairs, failure_aware)
+        delivered = sum(1 for success, _ in routes if success)
+        rows.append({"Failure_Aware": failure_aware, "Per_Packet_ms": round(latency * 1000, 3), "Delivered": delivered, "Pairs": len(pairs)})
+
+    for row in rows:
+        print(f"failure_aware={row['Failure_Aware']!s:>5}: {row['Per_Packet_ms']:>9.3f} ms/packet, delivered {row['Delivered']}/{row['Pairs']}")
+
+    save_results_to_csv(RESULTS_FILE, "failure_aware", "Failure_Aware", rows)
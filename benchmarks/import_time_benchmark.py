@@ -0,0 +1,53 @@
+# Measures the import time of the routing_sim modules in fresh interpreters
+# Author: Leon Okida
+# Last modification: 10/19/2026
+# Usage: python -m benchmarks.import_time_benchmark
+
+import os
+import statistics
+import subprocess
+import sys
+from benchmarks.results import RESULTS_FILE, save_results_to_csv
+
+# Entry points of the networkx-free fast path and of the networkx-backed code
+MODULES = [
+    "routing_sim.compact_topology",
+    "routing_sim.metrics",
+    "routing_sim.batch_metrics",
+    "routing_sim.routing_algorithms.forwarding_table_routing",
+    "routing_sim.simulation_engine.frr_simulation_engine",
+    "routing_sim.simulation_engine.arborescence_simulation_engine",
+    "routing_sim.routing_algorithms.max_flow_routing",
+    "routing_sim.topology_generation",
+]
+
+MEASURE_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, 'networkx' in sys.modules)
+"""
+
+def measure_import(module: str, repetitions: int) -> tuple[float, bool]:
+    # Returns the median import time in seconds and whether networkx was loaded
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    loads_networkx = False
+    for _ in range(repetitions):
+        output = subprocess.run([sys.executable, "-c", MEASURE_SCRIPT.format(module=module)],
+                                cwd=root, capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+        loads_networkx = output[1] == "True"
+    return statistics.median(times), loads_networkx
+
+if __name__ == '__main__':
+    # --- Configuration ---
+    REPETITIONS = 5
+
+    rows = []
+    for module in MODULES:
+        import_time, loads_networkx = measure_import(module, REPETITIONS)
+        rows.append({"Module": module, "Import_ms": round(import_time * 1000, 3), "Loads_Networkx": loads_networkx})
+        print(f"{module:>62}: {import_time * 1000:>8.3f} ms (networkx loaded: {loads_networkx})")
+
+    save_results_to_csv(RESULTS_FILE, "import_time", "Module", rows)
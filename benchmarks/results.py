@@ -0,0 +1,24 @@
+# Helpers to record benchmark results
+# Author: Leon Okida
+# Last modification: 10/19/2026
+
+import os
+import csv
+
+# All the benchmarks share this file, so it uses a fixed long format
+RESULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_results.csv")
+HEADERS = ["Benchmark", "Case", "Metric", "Value"]
+
+def save_results_to_csv(file_path: str, benchmark_name: str, case_column: str, rows: list[dict]) -> None:
+    # Appends one line per (case, metric) of the benchmark rows, writing the header if the file is new
+    # row[case_column] identifies the case, every other column is recorded as a metric
+    file_exists = os.path.isfile(file_path) and os.path.getsize(file_path) > 0
+
+    with open(file_path, mode='a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=HEADERS)
+        if not file_exists:
+            writer.writeheader()
+        for row in rows:
+            for metric, value in row.items():
+                if metric != case_column:
+                    writer.writerow({"Benchmark": benchmark_name, "Case": row[case_column], "Metric": metric, "Value": value})
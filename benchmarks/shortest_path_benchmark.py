@@ -0,0 +1,61 @@
+# Compares the per-hop latency of the shortest path query methods
+# Author: Leon Okida
+# Last modification: 10/19/2026
+# Usage: python -m benchmarks.shortest_path_benchmark
+
+import random
+import time
+from routing_sim.network import Network
+from routing_sim.routing_algorithms.dijkstra_routing import DijsktraRouting
+from routing_sim.routing_algorithms.shortest_path_engine import ShortestPathEngine
+from routing_sim.topology_generation import random_graph
+from benchmarks.results import RESULTS_FILE, save_results_to_csv
+
+def build_topology(size: int, connectivity: float, max_weight: int, seed: int):
+    # Random connected topology with random integer link weights
+    random.seed(seed)
+    graph = random_graph(size, connectivity)
+    for u, v in graph.edges:
+        graph[u][v]["weight"] = random.randint(1, max_weight)
+    return Network.from_networkx_graph(graph).topology
+
+def time_next_hops(algorithm, topology, queries: list) -> tuple[float, list]:
+    # Returns the average latency per next hop computation and the computed next hops
+    results = []
+    start = time.perf_counter()
+    for source, dest in queries:
+        results.append(algorithm.calculate_next_hop(source, dest, topology, {source}))
+    elapsed = time.perf_counter() - start
+    return elapsed / len(queries), results
+
+if __name__ == '__main__':
+    # --- Configuration ---
+    SIZE = 500
+    CONNECTIVITY = 0.01
+    MAX_WEIGHT = 10
+    NUMBER_OF_QUERIES = 200
+    NUMBER_OF_LANDMARKS = 8
+    SEED = 42
+
+    topology = build_topology(SIZE, CONNECTIVITY, MAX_WEIGHT, SEED)
+    nodes = list(topology.nodes)
+    queries = [tuple(random.sample(nodes, 2)) for _ in range(NUMBER_OF_QUERIES)]
+    print(f"Topology: {topology.number_of_nodes()} nodes, {topology.number_of_edges()} edges")
+
+    # Baseline: the current helper (one full Dijkstra per neighbor)
+    baseline_latency, baseline_hops = time_next_hops(DijsktraRouting(), topology, queries)
+    rows = [{"Method": "networkx helper", "Preprocessing_s": 0, "Per_Hop_ms": round(baseline_latency * 1000, 3), "Exact": True}]
+
+    for method in ShortestPathEngine.METHODS:
+        engine = ShortestPathEngine(method=method, number_of_landmarks=NUMBER_OF_LANDMARKS)
+        start = time.perf_counter()
+        engine.prepare(topology)
+        preprocessing = time.perf_counter() - start
+
+        latency, hops = time_next_hops(DijsktraRouting(shortest_path_engine=engine), topology, queries)
+        rows.append({"Method": method, "Preprocessing_s": round(preprocessing, 3), "Per_Hop_ms": round(latency * 1000, 3), "Exact": hops == baseline_hops})
+
+    for row in rows:
+        print(f"{row['Method']:>16}: {row['Per_Hop_ms']:>9.3f} ms/hop (preprocessing {row['Preprocessing_s']} s, exact={row['Exact']})")
+
+    save_results_to_csv(RESULTS_FILE, "shortest_path", "Method", rows)
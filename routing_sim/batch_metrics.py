@@ -0,0 +1,122 @@
+# Vectorized path metrics for batches of completed routes
+# Author: Leon Okida
+# Last modification: 10/19/2026
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import numpy as np
+from routing_sim.compact_topology import CompactTopology
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+def _hop_distances_to(d: int, indptr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    # Level-synchronous BFS from d over the CSR arrays, -1 marks unreachable nodes
+    distances = np.full(len(indptr) - 1, -1, dtype=np.int64)
+    distances[d] = 0
+    frontier = np.array([d], dtype=np.int64)
+    level = 0
+    while frontier.size:
+        level += 1
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        # Gathers the neighbor slices of every frontier node at once
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        neighbors = np.unique(indices[positions])
+        frontier = neighbors[distances[neighbors] == -1]
+        distances[frontier] = level
+    return distances
+
+def _get_number_of_paths_for_node(graph: nx.Graph, residual: nx.DiGraph, source: str | int, dest: str | int):
+    # Same as RoutingMetrics._get_number_of_paths_for_node, on the shared residual network
+    import networkx as nx
+    from networkx.algorithms.flow import preflow_push
+    try:
+        return nx.maximum_flow_value(graph, source, dest, capacity="capacity", flow_func=preflow_push, residual=residual)
+    except Exception:
+        return 0
+
+def _alternate_routes(paths: list[list], topology: nx.Graph | CompactTopology) -> np.ndarray:
+    # Average number of edge-disjoint paths from the intermediate routers to the destination once the
+    # route's links are removed, the same metric as RoutingMetrics. One residual network is shared by
+    # the whole batch, removing a link is done by zeroing its capacity in both directions.
+    import networkx as nx
+    from networkx.algorithms.flow import build_residual_network
+
+    if isinstance(topology, CompactTopology):
+        graph = nx.Graph()
+        graph.add_nodes_from(topology.nodes)
+        for u in range(topology.number_of_nodes()):
+            for position in range(topology.offsets[u], topology.offsets[u + 1]):
+                graph.add_edge(topology.nodes[u], topology.nodes[topology.neighbor_indices[position]], capacity=topology.capacities[position])
+    else:
+        graph = topology
+    residual = build_residual_network(graph, "capacity")
+
+    averages = np.full(len(paths), np.nan)
+    for k, route in enumerate(paths):
+        nodes_to_check = route[1:-1]
+        if not nodes_to_check:
+            continue
+
+        # A link used more than once by the route is only zeroed (and restored) once
+        route_links = {frozenset((u, v)) for u, v in zip(route, route[1:]) if u != v and residual.has_edge(u, v)}
+        saved_capacities = []
+        for u, v in route_links:
+            saved_capacities.append((u, v, residual[u][v]["capacity"], residual[v][u]["capacity"]))
+            residual[u][v]["capacity"] = residual[v][u]["capacity"] = 0
+
+        try:
+            total_alternate_paths = 0
+            for node in nodes_to_check:
+                total_alternate_paths += _get_number_of_paths_for_node(graph, residual, node, route[-1])
+            averages[k] = total_alternate_paths / len(nodes_to_check)
+        finally:
+            for u, v, forward, backward in saved_capacities:
+                residual[u][v]["capacity"] = forward
+                residual[v][u]["capacity"] = backward
+
+    return averages
+
+def compute_batch_metrics(paths: list[list], topology: nx.Graph | CompactTopology, shortest_distances: np.ndarray | None = None, alternate_routes: bool = True) -> dict[str, np.ndarray]:
+    # Computes the metrics of RoutingMetrics for many completed routes at once, without printing.
+    # Returns one NumPy column per metric, aligned with paths. shortest_distances (in hops, one per path)
+    # is computed with a BFS per destination if not given. Avg. alternate routes is NaN for routes
+    # without intermediate routers or if alternate_routes is False (it is the only metric that needs networkx).
+    if any(len(route) == 0 for route in paths):
+        raise ValueError("Every path must contain at least one router")
+
+    compact = topology if isinstance(topology, CompactTopology) else CompactTopology.from_networkx_graph(topology)
+    indptr = np.asarray(compact.offsets, dtype=np.int64)
+    indices = np.asarray(compact.neighbor_indices, dtype=np.int64)
+    degrees = np.diff(indptr)
+
+    # 1. Length of the routes and 2. Sum of degrees of the vertices in the routes
+    lengths = np.fromiter((len(route) for route in paths), dtype=np.int64, count=len(paths))
+    starts = np.cumsum(lengths) - lengths
+    flat_route = np.fromiter((compact.node_index[node] for route in paths for node in route), dtype=np.int64, count=int(lengths.sum()))
+    route_length = lengths - 1
+    total_degree = np.add.reduceat(degrees[flat_route], starts) if len(paths) else np.zeros(0, dtype=np.int64)
+
+    # 3. Stretch against the shortest distance, with the BFS shared by all routes to the same destination
+    if shortest_distances is None:
+        sources = flat_route[starts]
+        destinations = flat_route[starts + lengths - 1]
+        shortest_distances = np.empty(len(paths), dtype=np.float64)
+        for d in np.unique(destinations):
+            selected = destinations == d
+            shortest_distances[selected] = _hop_distances_to(int(d), indptr, indices)[sources[selected]]
+    shortest_distances = np.array(shortest_distances, dtype=np.float64)
+    shortest_distances[shortest_distances < 0] = np.nan
+    stretch = np.divide(route_length, shortest_distances, out=np.where(shortest_distances == 0, 1.0, np.nan), where=shortest_distances > 0)
+
+    # 4. Average alternate routes
+    avg_alternate_routes = _alternate_routes(paths, topology) if alternate_routes else np.full(len(paths), np.nan)
+
+    return {
+        "route_length": route_length,
+        "total_degree": total_degree,
+        "shortest_distance": shortest_distances,
+        "stretch": stretch,
+        "avg_alternate_routes": avg_alternate_routes,
+    }
@@ -0,0 +1,83 @@
+# Array-based (CSR) representation of a topology that does not depend on networkx
+# Author: Leon Okida
+# Last modification: 10/19/2026
+
+from array import array
+from routing_sim.topology_version import new_topology_version
+
+class CompactTopology:
+    # Neighbors of the node with index i are neighbor_indices[offsets[i]:offsets[i + 1]],
+    # with the link attributes stored at the same positions of weights and capacities
+    def __init__(self, nodes: list, edges: list[tuple]):
+        # edges is a list of (u, v, weight, capacity) tuples, links are undirected
+        self.version = new_topology_version()
+        self.nodes = list(nodes)
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+
+        adjacency = [dict() for _ in self.nodes]
+        for u, v, weight, capacity in edges:
+            if u == v:
+                continue
+            i, j = self.node_index[u], self.node_index[v]
+            adjacency[i][j] = (weight, capacity)
+            adjacency[j][i] = (weight, capacity)
+
+        self.offsets = array("l", [0])
+        self.neighbor_indices = array("i")
+        self.weights = array("d")
+        self.capacities = array("d")
+        for links in adjacency:
+            for j, (weight, capacity) in links.items():
+                self.neighbor_indices.append(j)
+                self.weights.append(weight)
+                self.capacities.append(capacity)
+            self.offsets.append(len(self.neighbor_indices))
+
+    @classmethod
+    def from_networkx_graph(cls, graph):
+        # Builds the compact topology from a networkx graph (or a Network topology)
+        edges = [(u, v, data.get('weight', 1), data.get('capacity', 1)) for u, v, data in graph.edges(data=True)]
+        return cls(list(graph.nodes), edges)
+
+    @classmethod
+    def read_edgelist(cls, filename: str):
+        # Reads a topology file without networkx, with the same defaults as topology_generation.read_graph
+        # (node names are strings, every link has weight 1 and capacity 1)
+        nodes = dict()
+        edges = []
+        with open(filename, encoding='utf-8') as f:
+            for line in f:
+                fields = line.split("#")[0].split(maxsplit=2)
+                if len(fields) < 2:
+                    continue
+                u, v = fields[0], fields[1]
+                nodes.setdefault(u, None)
+                nodes.setdefault(v, None)
+                edges.append((u, v, 1, 1))
+        return cls(list(nodes), edges)
+
+    def number_of_nodes(self) -> int:
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        return len(self.neighbor_indices) // 2
+
+    def neighbors(self, node: str | int):
+        i = self.node_index[node]
+        return (self.nodes[j] for j in self.neighbor_indices[self.offsets[i]:self.offsets[i + 1]])
+
+    def degree(self, node: str | int) -> int:
+        i = self.node_index[node]
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def has_edge(self, u: str | int, v: str | int) -> bool:
+        if u not in self.node_index or v not in self.node_index:
+            return False
+        i, j = self.node_index[u], self.node_index[v]
+        return j in self.neighbor_indices[self.offsets[i]:self.offsets[i + 1]]
+
+    def __contains__(self, node: str | int) -> bool:
+        return node in self.node_index
+
+    def __len__(self) -> int:
+        return len(self.nodes)
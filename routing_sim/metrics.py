@@ -1,18 +1,26 @@
 # Tools for logging routing messages and calculating path metrics
 # Author: Leon Okida
-# Last modification: 01/27/2026
+# Last modification: 10/19/2026
 
-import networkx as nx
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from routing_sim.packet import Packet
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm
+from routing_sim.compact_topology import CompactTopology
 import os
 import csv
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 class RoutingMetrics:
-    def __init__(self, debug_print: bool = True):
+    def __init__(self, debug_print: bool = True, alternate_routes: bool = True):
+        # alternate_routes=False skips the max flow based metric, which is the only one that needs networkx
+        # The metric is also skipped for a CompactTopology, which does not support it
         self.logs = []
         self.backtrack_counter = 0
         self.debug_print = debug_print
+        self.alternate_routes = alternate_routes
 
     def log_forwarding(self, router_name: str | int, next_hop: str | int):
         # Logs a hop
@@ -47,6 +55,7 @@ class RoutingMetrics:
     @staticmethod
     def _get_number_of_paths_for_node(graph: nx.Graph, source: str | int, dest: str | int):
         # Computes the number of paths from source to dest
+        import networkx as nx
         try:
             return nx.maximum_flow_value(graph, source, dest, capacity='capacity')
         except nx.NetworkXNoPath:
@@ -54,7 +63,7 @@ class RoutingMetrics:
         except Exception:
             return 0
 
-    def compute_final_metrics(self, packet: Packet, global_topology: nx.Graph):
+    def compute_final_metrics(self, packet: Packet, global_topology: nx.Graph | CompactTopology):
         # Computes and prints final metrics for the successful route.
         route = packet.path
         if not route or route[-1] != packet.destination:
@@ -75,19 +84,23 @@ class RoutingMetrics:
 
         # 3. Average alternate path neighbors
         dest = route[-1]
-        temp_graph = global_topology.copy()
-
-        # Remove edges in the used route (simulating failure of the primary path)
-        for i in range(len(route) - 1):
-            u = route[i]
-            v = route[i+1]
-            if temp_graph.has_edge(u, v):
-                temp_graph.remove_edge(u, v)
-
         total_alternate_paths = 0
         nodes_to_check = route[1:-1] # Exclude source and destination
 
-        if nodes_to_check:
+        if not self.alternate_routes:
+            print("3. Avg. Alternate Routes: N/A (Disabled)")
+        elif isinstance(global_topology, CompactTopology):
+            print("3. Avg. Alternate Routes: N/A (Not supported on a CompactTopology)")
+        elif nodes_to_check:
+            temp_graph = global_topology.copy()
+
+            # Remove edges in the used route (simulating failure of the primary path)
+            for i in range(len(route) - 1):
+                u = route[i]
+                v = route[i+1]
+                if temp_graph.has_edge(u, v):
+                    temp_graph.remove_edge(u, v)
+
             # We check max edge-disjoint paths (flow value with capacity=1)
             for node in nodes_to_check:
                 alternate_paths = self._get_number_of_paths_for_node(temp_graph, node, dest)
@@ -101,7 +114,7 @@ class RoutingMetrics:
         print(f"Backtracks Performed: {self.backtrack_counter}")
         print("="*40)
         
-    def save_metrics_to_csv(self, file_path: str, experiment_name: str, algorithm: RoutingAlgorithm, packet: Packet, global_topology: nx.Graph):
+    def save_metrics_to_csv(self, file_path: str, experiment_name: str, algorithm: RoutingAlgorithm, packet: Packet, global_topology: nx.Graph | CompactTopology):
         """
         Computes metrics and saves them to a CSV file, including an experiment identifier.
         """
@@ -115,16 +128,17 @@ class RoutingMetrics:
         
         # Calculate Average Alternate Routes (disjoint paths to destination)
         dest = route[-1]
-        temp_graph = global_topology.copy()
-        for i in range(len(route) - 1):
-            u, v = route[i], route[i+1]
-            if temp_graph.has_edge(u, v):
-                temp_graph.remove_edge(u, v)
-
         total_alternate_paths = 0
-        nodes_to_check = route[1:-1]
+        alternate_routes_supported = self.alternate_routes and not isinstance(global_topology, CompactTopology)
+        nodes_to_check = route[1:-1] if alternate_routes_supported else []
         avg_alternate_paths = 0
         if nodes_to_check:
+            temp_graph = global_topology.copy()
+            for i in range(len(route) - 1):
+                u, v = route[i], route[i+1]
+                if temp_graph.has_edge(u, v):
+                    temp_graph.remove_edge(u, v)
+
             for node in nodes_to_check:
                 # Using the existing helper method
                 total_alternate_paths += self._get_number_of_paths_for_node(temp_graph, node, dest)
@@ -145,7 +159,7 @@ class RoutingMetrics:
             "Algorithm": algorithm.name,
             "Route_Length": route_length,
             "Total_Degree": total_degree,
-            "Avg_Alternate_Routes": round(avg_alternate_paths, 3),
+            "Avg_Alternate_Routes": round(avg_alternate_paths, 3) if alternate_routes_supported else "N/A",
             "Backtracks": self.backtrack_counter
         }
 
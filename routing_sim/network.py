@@ -1,27 +1,52 @@
 # The class that represents a Network of routers
 # Author: Leon Okida
-# Last modification: 01/26/2026
+# Last modification: 10/19/2026
 
-import networkx as nx
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from routing_sim.router import Router
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm
+from routing_sim.compact_topology import CompactTopology
+from routing_sim.topology_version import bump_topology_version, get_topology_version
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 class Network:
-    def __init__(self):
+    def __init__(self, topology: nx.Graph | CompactTopology | None = None):
+        # networkx is only loaded when no topology is given and an empty networkx graph is built
+        # A network over a CompactTopology is read-only, routers and links cannot be added to it
+        if topology is None:
+            import networkx as nx
+            topology = nx.Graph()
         self.routers = {} 
-        self.topology = nx.Graph()
+        self.topology = topology
+
+        # Every change made through the network gives the topology a new version,
+        # which invalidates the data that routing algorithms precomputed for it
+        if get_topology_version(topology) is None:
+            bump_topology_version(topology)
+
+    def _check_mutable(self):
+        # CompactTopology is immutable, so routers and links can only be added to networkx topologies
+        if isinstance(self.topology, CompactTopology):
+            raise ValueError("Cannot modify a Network built over a CompactTopology, it is read-only")
 
     def add_router(self, router_name: str | int):
         # Adds a router to the topology
+        self._check_mutable()
         if router_name not in self.routers:
             new_router = Router(name=router_name)
             self.routers[router_name] = new_router
             self.topology.add_node(router_name)
+            bump_topology_version(self.topology)
         return self.routers[router_name]
 
     def add_link(self, router_a_name: str | int, router_b_name: str | int, weight: int = 1, capacity: int = 1):
         # Adds a link between two routers
+        self._check_mutable()
         self.topology.add_edge(router_a_name, router_b_name, weight=weight, capacity=capacity)
+        bump_topology_version(self.topology)
     
     @classmethod
     def from_networkx_graph(cls, graph: nx.Graph):
@@ -38,4 +63,12 @@ class Network:
             new_network.add_link(u, v, weight=weight, capacity=capacity)
             
         return new_network
+
+    @classmethod
+    def from_compact_topology(cls, topology: CompactTopology):
+        # Initializes a read-only network over a CompactTopology, without loading networkx
+        new_network = cls(topology=topology)
+        for router_name in topology.nodes:
+            new_network.routers[router_name] = Router(name=router_name)
+        return new_network
     
\ No newline at end of file
@@ -1,20 +1,33 @@
 # The class that represents a Router
 # Author: Leon Okida
-# Last modification: 01/26/2026
+# Last modification: 10/19/2026
 
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from routing_sim.packet import Packet
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm 
-import networkx as nx
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 class Router:
     def __init__(self, name): 
         self.name = name
 
-    def get_next_hop(self, packet: Packet, global_topology: nx.Graph, routing_algorithm: RoutingAlgorithm) -> list:
+    def get_next_hop(self, packet: Packet, global_topology: nx.Graph, routing_algorithm: RoutingAlgorithm, failed_edges: set | None = None) -> list:
         # Returns the list of next hop candidates based on the routing algorithm    
+        # failed_edges is only passed on when given, so algorithms without the argument keep working
+        if failed_edges is None:
+            return routing_algorithm.calculate_next_hop(
+                source=self.name,
+                dest=packet.destination,
+                global_topology=global_topology,
+                visited_names=packet.visited 
+            )
         return routing_algorithm.calculate_next_hop(
             source=self.name,
             dest=packet.destination,
             global_topology=global_topology,
-            visited_names=packet.visited 
+            visited_names=packet.visited,
+            failed_edges=failed_edges
         )
@@ -1,17 +1,22 @@
 # The arborecence-based routing algorithm, using a precomputed arborescence packing
 # Author: Leon Okida
-# Last modification: 01/27/2026
+# Last modification: 10/19/2026
 
 import networkx as nx
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm
+from routing_sim.routing_algorithms.arborescence_store import ArborescenceStore
 import copy
 
 class ArborescenceRouting(RoutingAlgorithm):
-    def __init__(self):
+    def __init__(self, max_resident_destinations: int | None = None, spill_file_path: str | None = None):
+        # If max_resident_destinations is set, the packing is computed lazily and only that many
+        # destinations are kept in memory, the rest are spilled to a memory-mapped file
         super().__init__("Arborescence Routing")
         self.arborescence_packing = dict()
         self.number_of_arborescences = 0
         self.arborescence_index = 0
+        self.max_resident_destinations = max_resident_destinations
+        self.spill_file_path = spill_file_path
 
     def _condition_1(self, r: str | int, c: int, topology: nx.DiGraph) -> bool:
         # Tests condition 1 of Tarjan's Algorithm
@@ -93,6 +98,17 @@ class ArborescenceRouting(RoutingAlgorithm):
         self.number_of_arborescences = connectivity_c
         print(f"The edge-connectivity of the topology is {connectivity_c}")
 
+        # Memory-bounded mode: arborescences are computed on first use of each destination
+        if self.max_resident_destinations is not None:
+            self.arborescence_packing = ArborescenceStore(
+                nodes=list(topology.nodes),
+                number_of_arborescences=connectivity_c,
+                loader=lambda d: self._compute_rooted_arborescences(d, connectivity_c, topology),
+                max_resident_destinations=self.max_resident_destinations,
+                file_path=self.spill_file_path
+            )
+            return
+
         # Iterate over every possible destination d
         for d in topology.nodes:
             d_arborescences = self._compute_rooted_arborescences(d, connectivity_c, topology)
@@ -101,11 +117,21 @@ class ArborescenceRouting(RoutingAlgorithm):
     def switch_arborescence(self) -> None:
         self.arborescence_index = (self.arborescence_index + 1) % self.number_of_arborescences
 
-    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set) -> list:      
+    def cache_parameters(self) -> tuple:
+        # The next hop depends on the arborescence currently in use
+        return super().cache_parameters() + (self.number_of_arborescences, self.arborescence_index)
+
+    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set, failed_edges: set = frozenset()) -> list:      
         # Calculates the next hop based on the arborescences
+        # failed_edges is ignored: failures are handled by the simulation engine switching arborescences
         if dest not in self.arborescence_packing:
             return None
 
+        # Memory-bounded mode stores each arborescence as a parent map
+        if isinstance(self.arborescence_packing, ArborescenceStore):
+            next_hop = self.arborescence_packing[dest][self.arborescence_index].get(source)
+            return [next_hop] if next_hop is not None else None
+
         # Returns the successor of source in the arborescence corresponding to dest (it's the next hop in the path to dest)
         for next_hop in self.arborescence_packing[dest][self.arborescence_index].successors(source):
             return [next_hop]
@@ -0,0 +1,98 @@
+# Memory-bounded storage for per-destination arborescence packings
+# Author: Leon Okida
+# Last modification: 10/19/2026
+
+from collections import OrderedDict
+from typing import Callable
+import mmap
+import tempfile
+import networkx as nx
+
+class ArborescenceStore:
+    # Each arborescence is stored as a parent map (node -> next hop towards the root).
+    # Arborescences are computed on first use, the most recently used destinations are kept
+    # in memory and the rest are spilled to a memory-mapped file of 32-bit node indices.
+    NO_PARENT = -1
+    ITEM_SIZE = 4
+
+    def __init__(self, nodes: list, number_of_arborescences: int, loader: Callable[[str | int], list[nx.DiGraph]],
+                 max_resident_destinations: int = 64, file_path: str | None = None):
+        if max_resident_destinations < 1:
+            raise ValueError("max_resident_destinations must be at least 1")
+
+        self.nodes = list(nodes)
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+        self.number_of_arborescences = number_of_arborescences
+        self.loader = loader
+        self.max_resident_destinations = max_resident_destinations
+
+        self.resident = OrderedDict()
+        self.spilled = set()
+
+        # One row of n indices per (destination, arborescence)
+        self._row_length = len(self.nodes)
+        size = max(len(self.nodes) * number_of_arborescences * self._row_length * self.ITEM_SIZE, mmap.PAGESIZE)
+        self._file = open(file_path, "w+b") if file_path else tempfile.TemporaryFile()
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._table = memoryview(self._mmap).cast("i")
+
+    def __contains__(self, dest: str | int) -> bool:
+        return dest in self.node_index
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __getitem__(self, dest: str | int) -> list[dict]:
+        # Returns the parent maps of the dest-rooted arborescences
+        if dest in self.resident:
+            self.resident.move_to_end(dest)
+            return self.resident[dest]
+
+        if dest in self.spilled:
+            parent_maps = self._read(dest)
+        elif dest in self.node_index:
+            parent_maps = [self._to_parent_map(arbo) for arbo in self.loader(dest)]
+        else:
+            raise KeyError(dest)
+
+        self.resident[dest] = parent_maps
+        self._evict()
+        return parent_maps
+
+    @staticmethod
+    def _to_parent_map(reversed_arborescence: nx.DiGraph) -> dict:
+        # In the reversed arborescence every node points to its parent
+        return {u: v for u, v in reversed_arborescence.edges}
+
+    def _offset(self, dest: str | int, arborescence_index: int) -> int:
+        return (self.node_index[dest] * self.number_of_arborescences + arborescence_index) * self._row_length
+
+    def _write(self, dest: str | int, parent_maps: list[dict]) -> None:
+        for j, parent_map in enumerate(parent_maps):
+            offset = self._offset(dest, j)
+            for i, node in enumerate(self.nodes):
+                parent = parent_map.get(node)
+                self._table[offset + i] = self.node_index[parent] if parent is not None else self.NO_PARENT
+        self.spilled.add(dest)
+
+    def _read(self, dest: str | int) -> list[dict]:
+        parent_maps = []
+        for j in range(self.number_of_arborescences):
+            offset = self._offset(dest, j)
+            row = self._table[offset:offset + self._row_length]
+            parent_maps.append({self.nodes[i]: self.nodes[p] for i, p in enumerate(row) if p != self.NO_PARENT})
+        return parent_maps
+
+    def _evict(self) -> None:
+        # Spills the least recently used destinations (arborescences never change, so each is written once)
+        while len(self.resident) > self.max_resident_destinations:
+            dest, parent_maps = self.resident.popitem(last=False)
+            if dest not in self.spilled:
+                self._write(dest, parent_maps)
+
+    def close(self) -> None:
+        # Releases the memory-mapped file
+        self._table.release()
+        self._mmap.close()
+        self._file.close()
@@ -1,31 +1,37 @@
 # The routing algorithm based on Dijkstra's algorithm
 # Author: Leon Okida
-# Last modification: 01/27/2026
+# Last modification: 10/19/2026
 
 import networkx as nx
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm
 import routing_sim.routing_algorithms.utils as utils
+from routing_sim.routing_algorithms.shortest_path_engine import ShortestPathEngine
 
 class DijsktraRouting(RoutingAlgorithm):
-    def __init__(self):
+    def __init__(self, shortest_path_engine: ShortestPathEngine | None = None):
         super().__init__("Algorithm based on Dijkstra's")
+        self.shortest_path_engine = shortest_path_engine
 
-    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set) -> list:
+    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set, failed_edges: set = frozenset()) -> list:
         # Calculates and returns a list of next hops sorted by shortest path length (ascending)
         scored_neighbors = []
         
-        # Considers only unvisited neighbors that are not the source itself
-        neighbors = [n for n in global_topology.neighbors(source) if n != source and n not in visited_names]
+        # Considers only unvisited neighbors that are not the source itself and are reachable through a working link
+        neighbors = [n for n in global_topology.neighbors(source) if n != source and n not in visited_names and (source, n) not in failed_edges]
         
         if not neighbors:
             return []
 
+        # Landmarks are computed on the full topology, so they remain valid on temp_graph
+        if self.shortest_path_engine is not None and not self.shortest_path_engine.is_prepared_for(global_topology):
+            self.shortest_path_engine.prepare(global_topology)
+
         # Removes the source vertex from the graph used in the computation
         temp_graph = global_topology.copy()
         temp_graph.remove_node(source)
 
         for neighbor in neighbors:
-            score = utils.get_shortest_path_length(neighbor, dest, temp_graph)
+            score = utils.get_shortest_path_length(neighbor, dest, temp_graph, self.shortest_path_engine)
             
             # Only include neighbors that actually have a path to the destination
             if score != float('inf'):
@@ -0,0 +1,77 @@
+# Shortest path routing using array-based forwarding tables over a CompactTopology (does not need networkx)
+# Author: Leon Okida
+# Last modification: 10/19/2026
+
+from array import array
+import heapq
+from routing_sim.compact_topology import CompactTopology
+from routing_sim.routing_algorithms.interface import RoutingAlgorithm
+
+class ForwardingTableRouting(RoutingAlgorithm):
+    NO_HOP = -1
+
+    def __init__(self):
+        super().__init__("Forwarding Table Routing")
+        self.topology = None
+        self.forwarding_tables = dict()
+
+    def _distances_to(self, d: int) -> array:
+        # Dijkstra's from the destination index d over the link weights
+        topology = self.topology
+        distances = array("d", [float('inf')]) * topology.number_of_nodes()
+        distances[d] = 0
+        heap = [(0, d)]
+        while heap:
+            distance, u = heapq.heappop(heap)
+            if distance > distances[u]:
+                continue
+            for position in range(topology.offsets[u], topology.offsets[u + 1]):
+                v = topology.neighbor_indices[position]
+                candidate = distance + topology.weights[position]
+                if candidate < distances[v]:
+                    distances[v] = candidate
+                    heapq.heappush(heap, (candidate, v))
+        return distances
+
+    def _build_forwarding_table(self, d: int) -> array:
+        # For every node, its neighbors ranked by link weight + distance to d, stored in the node's
+        # slice of the CSR arrays; neighbors without a path to d are marked with NO_HOP
+        topology = self.topology
+        distances = self._distances_to(d)
+        table = array("i", [self.NO_HOP]) * len(topology.neighbor_indices)
+
+        for u in range(topology.number_of_nodes()):
+            start, end = topology.offsets[u], topology.offsets[u + 1]
+            scored = [(topology.weights[p] + distances[topology.neighbor_indices[p]], topology.neighbor_indices[p]) for p in range(start, end)]
+            scored = sorted((s for s in scored if s[0] != float('inf')), key=lambda s: s[0])
+            for k, (_, v) in enumerate(scored):
+                table[start + k] = v
+        return table
+
+    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: CompactTopology, visited_names: set, failed_edges: set = frozenset()) -> list:
+        # Returns the neighbors of source sorted by the length of the shortest path to dest through them
+        if global_topology is not self.topology:
+            self.topology = global_topology
+            self.forwarding_tables = dict()
+
+        if source not in global_topology.node_index or dest not in global_topology.node_index:
+            return []
+
+        d = global_topology.node_index[dest]
+        if d not in self.forwarding_tables:
+            self.forwarding_tables[d] = self._build_forwarding_table(d)
+        table = self.forwarding_tables[d]
+
+        next_hops = []
+        u = global_topology.node_index[source]
+        for position in range(global_topology.offsets[u], global_topology.offsets[u + 1]):
+            v = table[position]
+            if v == self.NO_HOP:
+                break
+            neighbor = global_topology.nodes[v]
+            if neighbor not in visited_names and (source, neighbor) not in failed_edges:
+                next_hops.append(neighbor)
+        return next_hops
+
+    def switch_arborescence(self) -> None:
+        raise NotImplementedError
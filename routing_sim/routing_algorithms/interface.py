@@ -1,18 +1,27 @@
 # The interface for classes that implement routing algorithms
 # Author: Leon Okida
-# Last modification: 01/27/2026
+# Last modification: 10/19/2026
 
+from __future__ import annotations
 from abc import ABC, abstractmethod
-import networkx as nx
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 class RoutingAlgorithm(ABC):
     def __init__(self, name: str):
         self.name = name
         
     @abstractmethod
-    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set) -> list:
+    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set, failed_edges: set = frozenset()) -> list:
+        # failed_edges holds the links known to be down; only links incident to source are considered (local failure knowledge)
         ...
 
     @abstractmethod
     def switch_arborescence(self) -> None:
-        ...
\ No newline at end of file
+        ...
+
+    def cache_parameters(self) -> tuple:
+        # Parameters that affect the output of calculate_next_hop, used as part of memoization keys
+        return (type(self).__name__, self.name)
\ No newline at end of file
@@ -1,30 +1,36 @@
 # The MaxFlowRouting algorithm
 # Author: Leon Okida
-# Last modification: 01/27/2026
+# Last modification: 10/19/2026
 
 import networkx as nx
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm
 import routing_sim.routing_algorithms.utils as utils
+from routing_sim.routing_algorithms.shortest_path_engine import ShortestPathEngine
 
 class MaxFlowRouting(RoutingAlgorithm):
-    def __init__(self, lambda_val: float = 0.8):
+    def __init__(self, lambda_val: float = 0.8, shortest_path_engine: ShortestPathEngine | None = None):
         super().__init__(f"MaxFlowRouting with lambda={lambda_val}")
         self.weight_mf = lambda_val
         self.weight_sp = (1 - lambda_val) * -1
+        self.shortest_path_engine = shortest_path_engine
 
-    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set) -> list:
+    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set, failed_edges: set = frozenset()) -> list:
         # Calculates and returns a list of next hops sorted by score (descending)
         scored_neighbors = []
         
-        neighbors = [n for n in global_topology.neighbors(source) if n != source and n not in visited_names]
+        neighbors = [n for n in global_topology.neighbors(source) if n != source and n not in visited_names and (source, n) not in failed_edges]
         if not neighbors:
             return []
 
+        # Landmarks are computed on the full topology, so they remain valid on temp_graph
+        if self.shortest_path_engine is not None and not self.shortest_path_engine.is_prepared_for(global_topology):
+            self.shortest_path_engine.prepare(global_topology)
+
         temp_graph = global_topology.copy()
         temp_graph.remove_node(source)
 
         for neighbor in neighbors:
-            sp_score = utils.get_shortest_path_length(neighbor, dest, temp_graph)
+            sp_score = utils.get_shortest_path_length(neighbor, dest, temp_graph, self.shortest_path_engine)
             if sp_score == float('inf'):
                 continue 
 
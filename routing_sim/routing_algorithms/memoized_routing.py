@@ -0,0 +1,109 @@
+# Memoization layer for the next hop rankings of any routing algorithm
+# Author: Leon Okida
+# Last modification: 10/19/2026
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+import hashlib
+import shelve
+from routing_sim.routing_algorithms.interface import RoutingAlgorithm
+from routing_sim.topology_version import get_topology_version, topology_digest
+
+if TYPE_CHECKING:
+    import networkx as nx
+    from routing_sim.compact_topology import CompactTopology
+
+class MemoizedRouting(RoutingAlgorithm):
+    # Wraps a routing algorithm and caches its rankings. The key holds everything that affects the
+    # output: algorithm parameters, topology version, failure set, source, dest and visited neighbors.
+    # Keys are stable digests, so the optional on-disk store can be reused by later runs.
+    _MISSING = object()
+
+    def __init__(self, algorithm: RoutingAlgorithm, max_entries: int = 100000, cache_file_path: str | None = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        super().__init__(algorithm.name)
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.disk_store = shelve.open(cache_file_path) if cache_file_path else None
+        self.hits = 0
+        self.misses = 0
+
+        # Digests are only recomputed when the topology version or the failure set change
+        self._topology_digest = (None, None)
+        self._failure_digest = (None, None)
+
+    @staticmethod
+    def _digest(items) -> str:
+        # Order-independent digest that does not depend on the interpreter's hash seed
+        return hashlib.sha1(repr(sorted(repr(item) for item in items)).encode()).hexdigest()
+
+    def _get_topology_digest(self, topology: nx.Graph | CompactTopology) -> str:
+        # The key needs a content digest to be reusable across runs, it is cached per version token
+        # (unversioned topologies are hashed on every call)
+        version = get_topology_version(topology)
+        if version is None:
+            return topology_digest(topology)
+        if self._topology_digest[0] != version:
+            self._topology_digest = (version, topology_digest(topology))
+        return self._topology_digest[1]
+
+    def _get_failure_digest(self, failed_edges: set) -> str:
+        failure_set = frozenset(failed_edges)
+        if self._failure_digest[0] != failure_set:
+            self._failure_digest = (failure_set, self._digest(failure_set))
+        return self._failure_digest[1]
+
+    def _key(self, source: str | int, dest: str | int, global_topology: nx.Graph | CompactTopology, visited_names: set, failed_edges: set) -> str:
+        # Only visited neighbors of source change the candidates, the rest of the visited set is irrelevant
+        visited_neighbors = [n for n in global_topology.neighbors(source) if n in visited_names]
+        key = (
+            self.algorithm.cache_parameters(),
+            self._get_topology_digest(global_topology),
+            self._get_failure_digest(failed_edges),
+            repr(source),
+            repr(dest),
+            self._digest(visited_neighbors)
+        )
+        return hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def _store(self, key: str, next_hops: list) -> None:
+        self.entries[key] = next_hops
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph | CompactTopology, visited_names: set, failed_edges: set = frozenset()) -> list:
+        # Returns the cached ranking, computing it with the wrapped algorithm on a miss
+        key = self._key(source, dest, global_topology, visited_names, failed_edges)
+
+        next_hops = self.entries.get(key, self._MISSING)
+        if next_hops is not self._MISSING:
+            self.entries.move_to_end(key)
+        elif self.disk_store is not None and key in self.disk_store:
+            next_hops = self.disk_store[key]
+            self._store(key, next_hops)
+        else:
+            self.misses += 1
+            next_hops = self.algorithm.calculate_next_hop(source, dest, global_topology, visited_names, failed_edges)
+            self._store(key, next_hops)
+            if self.disk_store is not None:
+                self.disk_store[key] = next_hops
+            return list(next_hops) if next_hops is not None else None
+
+        self.hits += 1
+        return list(next_hops) if next_hops is not None else None
+
+    def switch_arborescence(self) -> None:
+        self.algorithm.switch_arborescence()
+
+    def cache_parameters(self) -> tuple:
+        return self.algorithm.cache_parameters()
+
+    def close(self) -> None:
+        # Flushes and closes the on-disk store
+        if self.disk_store is not None:
+            self.disk_store.close()
+            self.disk_store = None
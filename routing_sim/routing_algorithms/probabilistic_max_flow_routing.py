@@ -1,6 +1,6 @@
 # The probabilistic version of the MaxFlowRouting algorithm
 # Author: Leon Okida
-# Last modification: 01/28/2026
+# Last modification: 10/19/2026
 
 import networkx as nx
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm
@@ -19,11 +19,11 @@ class ProbabilisticMaxFlowRouting(RoutingAlgorithm):
             cost += i * ((1 - self.p) ** i) * self.p
         return cost
 
-    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set) -> list:
+    def calculate_next_hop(self, source: str | int, dest: str | int, global_topology: nx.Graph, visited_names: set, failed_edges: set = frozenset()) -> list:
         # Calculates and returns a list of next hops sorted by score (descending)
         scored_neighbors = []
         
-        neighbors = [n for n in global_topology.neighbors(source) if n != source and n not in visited_names]
+        neighbors = [n for n in global_topology.neighbors(source) if n != source and n not in visited_names and (source, n) not in failed_edges]
         if not neighbors:
             return []
 
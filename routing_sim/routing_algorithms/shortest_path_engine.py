@@ -0,0 +1,87 @@
+# Point-to-point shortest path queries using landmark-based A* (ALT) or bidirectional Dijkstra
+# Author: Leon Okida
+# Last modification: 10/19/2026
+
+import networkx as nx
+from routing_sim.topology_version import topology_signature
+
+class ShortestPathEngine:
+    METHODS = ("alt", "bidirectional", "dijkstra")
+
+    def __init__(self, method: str = "alt", number_of_landmarks: int = 4):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown shortest path method '{method}'. Expected one of {self.METHODS}")
+        self.method = method
+        self.number_of_landmarks = number_of_landmarks
+        self.landmarks = []
+        self.landmark_distances = []
+        self._prepared_signature = None
+
+    def is_prepared_for(self, topology: nx.Graph) -> bool:
+        # Checks if the landmark distances were computed for the current state of this topology
+        # (stale landmarks are not admissible if link weights went down)
+        return self._prepared_signature == topology_signature(topology)
+
+    def _select_landmarks(self, topology: nx.Graph) -> None:
+        # Farthest-first selection: starts at the highest degree node and repeatedly
+        # adds the node that is farthest from all the landmarks chosen so far
+        self.landmarks = []
+        self.landmark_distances = []
+        if topology.number_of_nodes() == 0:
+            return
+
+        closest_landmark_distance = dict()
+        candidate = max(topology.nodes, key=topology.degree)
+
+        while len(self.landmarks) < min(self.number_of_landmarks, topology.number_of_nodes()):
+            distances = nx.single_source_dijkstra_path_length(topology, candidate, weight="weight")
+            self.landmarks.append(candidate)
+            self.landmark_distances.append(distances)
+
+            for node in topology.nodes:
+                closest_landmark_distance[node] = min(closest_landmark_distance.get(node, float('inf')), distances.get(node, float('inf')))
+
+            # Unreachable nodes are preferred, so every connected component gets a landmark
+            remaining = [n for n in topology.nodes if n not in self.landmarks]
+            if not remaining:
+                break
+            candidate = max(remaining, key=lambda n: closest_landmark_distance[n])
+
+    def prepare(self, topology: nx.Graph) -> None:
+        # Precomputes the landmark distances over the "weight" attribute of the topology
+        if self.method == "alt":
+            self._select_landmarks(topology)
+        self._prepared_signature = topology_signature(topology)
+
+    def _heuristic_to(self, dest: str | int):
+        # Builds the ALT lower bound h(v) = max_L |d(L, dest) - d(L, v)|
+        # The bound is computed on the prepared topology, so it stays admissible and consistent
+        # on any subgraph of it (e.g. the topology without the current router)
+        bounds = [(distances, distances[dest]) for distances in self.landmark_distances if dest in distances]
+
+        def heuristic(node, _target):
+            estimate = 0
+            for distances, dest_distance in bounds:
+                node_distance = distances.get(node)
+                if node_distance is None:
+                    continue
+                difference = abs(dest_distance - node_distance)
+                if difference > estimate:
+                    estimate = difference
+            return estimate
+
+        return heuristic
+
+    def shortest_path_length(self, source: str | int, dest: str | int, graph: nx.Graph):
+        # Calculates the exact shortest path length between source and dest in graph
+        # graph must be the prepared topology or a subgraph of it
+        if source == dest:
+            return 0
+        try:
+            if self.method == "alt":
+                return nx.astar_path_length(graph, source, dest, heuristic=self._heuristic_to(dest), weight="weight")
+            if self.method == "bidirectional":
+                return nx.bidirectional_dijkstra(graph, source, dest, weight="weight")[0]
+            return nx.shortest_path_length(graph, source, dest, weight="weight")
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            return float('inf')
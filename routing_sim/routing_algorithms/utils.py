@@ -1,13 +1,16 @@
 # Functions to compute Shortest Path and Max Flow values
 # Author: Leon Okida
-# Last modification: 10/19/2025
+# Last modification: 10/19/2026
 
 import networkx as nx
 
-def get_shortest_path_length(source: str | int, dest: str | int, graph: nx.Graph):
+def get_shortest_path_length(source: str | int, dest: str | int, graph: nx.Graph, shortest_path_engine=None):
         # Calculates the shortest path length between source and dest using Dijkstra's
+        # A prepared ShortestPathEngine can be given to answer the query with ALT or bidirectional search
         if source == dest:
             return 0
+        if shortest_path_engine is not None:
+            return shortest_path_engine.shortest_path_length(source, dest, graph)
         try:
             return nx.shortest_path_length(graph, source, dest, weight="weight")
         except nx.NetworkXNoPath:
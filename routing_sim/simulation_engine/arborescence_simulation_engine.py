@@ -1,6 +1,6 @@
 # Simulates routing between two routers in a network using Arborescences
 # Author: Leon Okida
-# Last modification: 01/27/2026
+# Last modification: 10/19/2026
 
 from routing_sim.simulation_engine.interface import SimulationEngine
 from routing_sim.network import Network
@@ -10,10 +10,10 @@ from routing_sim.metrics import RoutingMetrics
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm
 
 class ArborescenceSimulationEngine(SimulationEngine):
-    def __init__(self, network: Network, debug_print: bool = True):
+    def __init__(self, network: Network, debug_print: bool = True, alternate_routes: bool = True):
         super().__init__()
         self.network = network
-        self.metrics = RoutingMetrics(debug_print=debug_print)
+        self.metrics = RoutingMetrics(debug_print=debug_print, alternate_routes=alternate_routes)
         
     def _find_route_recursive(self, packet: Packet, source_router_name: str | int, algorithm: RoutingAlgorithm):
         # Function that simulates the forwarding function
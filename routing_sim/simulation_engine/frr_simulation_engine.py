@@ -1,6 +1,6 @@
 # Simulates routing between two routers in a network using FRR
 # Author: Leon Okida
-# Last modification: 01/27/2026
+# Last modification: 10/19/2026
 
 from routing_sim.simulation_engine.interface import SimulationEngine
 from routing_sim.network import Network
@@ -10,10 +10,13 @@ from routing_sim.metrics import RoutingMetrics
 from routing_sim.routing_algorithms.interface import RoutingAlgorithm
 
 class FRRSimulationEngine(SimulationEngine):
-    def __init__(self, network: Network, debug_print: bool = True):
+    def __init__(self, network: Network, debug_print: bool = True, failure_aware: bool = False, alternate_routes: bool = True):
+        # In failure-aware mode routers know the state of their own links, so the routing
+        # algorithm skips failed links and the candidates are scored once per visit
         super().__init__()
         self.network = network
-        self.metrics = RoutingMetrics(debug_print=debug_print)
+        self.metrics = RoutingMetrics(debug_print=debug_print, alternate_routes=alternate_routes)
+        self.failure_aware = failure_aware
         
     def _find_route_recursive(self, packet: Packet, source_router_name: str | int, algorithm: RoutingAlgorithm):
         # Function that simulates the forwarding function
@@ -30,8 +33,13 @@ class FRRSimulationEngine(SimulationEngine):
             self.metrics.log_success(packet.path)
             return True
         
+        if self.failure_aware:
+            return self._try_candidates_once(packet, source_router, algorithm)
+
         # Loop implements FRR, tries all the available routing options
-        candidate_index = 0
+        # The ranking is recomputed on every attempt: neighbors tried in a failed branch are now
+        # visited and drop out of it, while neighbors behind failed links have to be skipped explicitly
+        failed_next_hops = set()
         while True:
             # Get the best available next hop
             next_hop_candidates = source_router.get_next_hop(
@@ -39,20 +47,17 @@ class FRRSimulationEngine(SimulationEngine):
                 global_topology=self.network.topology,
                 routing_algorithm=algorithm
             )
+            next_hop = next((n for n in next_hop_candidates or [] if n not in failed_next_hops), None)
 
             # If no next hop is available, it backtracks
-            if (candidate_index >= len(next_hop_candidates)) or (next_hop_candidates is None):
-                parent_router = packet.path[-2] if len(packet.path) > 1 else ""
-                self.metrics.log_backtrack(source_router_name, parent_router)                
-                packet.record_backtracking_hop()
+            if next_hop is None:
+                self._backtrack(packet, source_router_name)
                 return False
-        
-            next_hop = next_hop_candidates[candidate_index]
             
             # Failure detected on the link to the next hop
             if ((source_router_name, next_hop) in self.failed_edges):
                 self.metrics.log_failure(source_router_name, next_hop)
-                next_hop_candidates += 1
+                failed_next_hops.add(next_hop)
                 continue
 
             # Next hop is found, the packet is forwarded
@@ -64,7 +69,39 @@ class FRRSimulationEngine(SimulationEngine):
                 return True
             else:
                 self.metrics.log_failure(source_router_name, next_hop)
-                next_hop_candidates += 1
+
+    def _try_candidates_once(self, packet: Packet, source_router: Router, algorithm: RoutingAlgorithm):
+        # Failure-aware forwarding: a single scoring pass over the neighbors behind working links
+        next_hop_candidates = source_router.get_next_hop(
+            packet=packet,
+            global_topology=self.network.topology,
+            routing_algorithm=algorithm,
+            failed_edges=self.failed_edges
+        ) or []
+
+        for next_hop in next_hop_candidates:
+            # Skips candidates reached (and abandoned) by an earlier attempt from this router
+            if next_hop in packet.visited:
+                continue
+
+            # Algorithms are not required to filter failed links, so link state is checked here too
+            if (source_router.name, next_hop) in self.failed_edges:
+                self.metrics.log_failure(source_router.name, next_hop)
+                continue
+
+            self.metrics.log_forwarding(source_router.name, next_hop)
+            if self._find_route_recursive(packet, next_hop, algorithm):
+                return True
+            self.metrics.log_failure(source_router.name, next_hop)
+
+        self._backtrack(packet, source_router.name)
+        return False
+
+    def _backtrack(self, packet: Packet, source_router_name: str | int):
+        # Returns the packet to the previous router
+        parent_router = packet.path[-2] if len(packet.path) > 1 else ""
+        self.metrics.log_backtrack(source_router_name, parent_router)
+        packet.record_backtracking_hop()
 
     def simulate_routing(self, source: str | int, dest: str | int, algorithm: RoutingAlgorithm, experiment_name: str, file_path: str) -> tuple:
         # Initiates the routing simulation
@@ -0,0 +1,47 @@
+# Tools to identify the current state of a topology, used to invalidate precomputed data
+# Author: Leon Okida
+# Last modification: 10/19/2026
+
+import hashlib
+import itertools
+
+# Version tokens are unique across all topologies of the process
+_version_counter = itertools.count(1)
+
+def new_topology_version() -> int:
+    # Returns a version token that was never used before
+    return next(_version_counter)
+
+def bump_topology_version(topology) -> None:
+    # Gives a networkx topology a new version token, must be called after every change to it
+    topology.graph["version"] = new_topology_version()
+
+def get_topology_version(topology) -> int | None:
+    # Returns the version token of a topology, or None if it is not versioned
+    # (networkx graphs are versioned by Network, a CompactTopology is immutable and versioned on creation)
+    graph_attributes = getattr(topology, "graph", None)
+    if graph_attributes is not None:
+        return graph_attributes.get("version")
+    return getattr(topology, "version", None)
+
+def topology_digest(topology) -> str:
+    # Digest of the nodes and link attributes that does not depend on the interpreter's hash seed,
+    # so it identifies the same topology across runs
+    if hasattr(topology, "neighbor_indices"):
+        # The CSR arrays of a CompactTopology are ordered, so they are hashed directly
+        digest = hashlib.sha1(repr(topology.nodes).encode())
+        for values in (topology.offsets, topology.neighbor_indices, topology.weights, topology.capacities):
+            digest.update(values.tobytes())
+        return digest.hexdigest()
+
+    items = [repr(node) for node in topology.nodes]
+    items += [repr((*sorted((repr(u), repr(v))), data.get("weight", 1), data.get("capacity", 1))) for u, v, data in topology.edges(data=True)]
+    return hashlib.sha1(repr(sorted(items)).encode()).hexdigest()
+
+def topology_signature(topology) -> tuple:
+    # Identifies the current state of a topology: its version token if it has one,
+    # otherwise a digest of its links (slower, but always exact)
+    version = get_topology_version(topology)
+    if version is not None:
+        return ("version", version)
+    return ("digest", topology_digest(topology))